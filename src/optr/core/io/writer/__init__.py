@@ -1,8 +1,9 @@
 from .background import BackgroundWriter
-from .protocols import Closable, Writer
+from .protocols import BatchWriter, Closable, Writer
 
 __all__ = [
     "BackgroundWriter",
+    "BatchWriter",
     "Closable",
     "Writer",
 ]
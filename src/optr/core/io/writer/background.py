@@ -1,7 +1,8 @@
 """BackgroundWriter that wraps a writer and makes it thread-safe with background processing."""
 
-import queue
+import os
 import threading
+from collections import deque
 from collections.abc import Callable
 from typing import Literal, Self
 
@@ -9,27 +10,51 @@ from .protocols import Closable
 
 type Event = Literal["complete", "error", "progress"]
 
+# Most items handed to the underlying writer per wakeup
+_MAX_BATCH = 32
+
 
 class BackgroundWriter[T](Closable[T]):
     """Wraps a Writer and provides non-blocking writes via background queue processing."""
 
-    def __init__(self, writer: Closable[T]) -> None:
-        """Initialize and start background processing thread."""
+    def __init__(
+        self,
+        writer: Closable[T],
+        capacity: int = 0,
+        cpus: set[int] | None = None,
+    ) -> None:
+        """Initialize and start background processing thread.
+
+        Args:
+            writer: Writer to hand data to from the background thread
+            capacity: Most items waiting in the queue; further writes are
+                dropped and counted. 0 means unbounded
+            cpus: CPUs to pin the background thread to, keeping it off the
+                producer's cores (Linux only; ignored elsewhere)
+        """
         self.writer = writer
-        self.queue: queue.Queue = queue.Queue(maxsize=0)
+        self.cpus = cpus
+        # deque append/popleft are atomic, so producers never take a lock;
+        # the event only wakes the worker when it is idle
+        self.queue: deque = deque()
+        self._ready = threading.Event()
+        self.capacity = capacity
         self.active = True
+        self._stopped = False
         self.queued = 0
         self.written = 0
+        self.dropped = 0
 
         # Event callbacks - initialized to noop functions
         self._on_complete: Callable[[], None] = lambda: None
         self._on_error: Callable[[Exception], None] = lambda e: None
         self._on_progress: Callable[[int, int], None] = lambda w, q: None
 
-        # Start processing thread immediately
+        # Start processing thread immediately. The worker sleeps until it
+        # has work, so a writer that is never closed must not block exit
         self.thread = threading.Thread(
             target=self._process_loop,
-            daemon=False,
+            daemon=True,
             name=f"background-writer-{getattr(writer, 'path', 'unknown')}",
         )
         self.thread.start()
@@ -53,16 +78,41 @@ class BackgroundWriter[T](Closable[T]):
                 self._on_progress = handler
         return self
 
-    def write(self, data: T) -> None:
-        """Write data to queue for background processing."""
+    def write(self, data: T, release: Callable[[], None] | None = None) -> None:
+        """Hand data off to the background queue without copying it.
+
+        The caller must not modify data until it has been written. `release`,
+        if given, is called from the background thread once it has been,
+        so the caller can reuse the buffer. When the queue is at capacity,
+        or the writer has closed or failed, the data is dropped and
+        released immediately.
+        """
         if not self.active:
+            self.dropped += 1
+            if release is not None:
+                release()
             return
 
-        try:
-            self.queue.put_nowait(data.copy() if hasattr(data, "copy") else data)
-            self.queued += 1
-        except queue.Full:
-            print("Warning: BackgroundWriter queue full, dropping data")
+        if self.capacity and len(self.queue) >= self.capacity:
+            # Full: drop instead of letting a slow writer grow memory
+            self.dropped += 1
+            if release is not None:
+                release()
+            return
+
+        self.queue.append((data, release))
+        self.queued += 1
+        if not self._ready.is_set():
+            self._ready.set()
+
+        # The worker may have stopped after the check above; nothing will
+        # write the item now, so give it back
+        if self._stopped:
+            self._release_pending()
+
+    def write_copy(self, data: T) -> None:
+        """Queue a snapshot of data, for callers that keep modifying it."""
+        self.write(data.copy() if hasattr(data, "copy") else data)
 
     def close(self) -> None:
         """Stop background processing and close underlying writer."""
@@ -71,9 +121,12 @@ class BackgroundWriter[T](Closable[T]):
 
         # Send end-of-stream sentinel
         self.active = False
-        self.queue.put(None)  # EOS marker
+        self.queue.append(None)  # EOS marker
+        self._ready.set()
 
-        # Wait for thread to finish (writer will be closed in _process_loop)
+        # Wait for thread to finish (writer will be closed in _process_loop).
+        # The worker wakes on EOS at once; the timeout only caps a writer
+        # whose own close() hangs
         if self.thread and self.thread.is_alive():
             self.thread.join(timeout=10)
 
@@ -82,33 +135,90 @@ class BackgroundWriter[T](Closable[T]):
                     "Warning: BackgroundWriter thread did not stop gracefully within timeout"
                 )
 
+    def _release_pending(self) -> None:
+        """Drop everything still queued, releasing it to its producers."""
+        while True:
+            try:
+                item = self.queue.popleft()
+            except IndexError:
+                return
+            if item is not None:
+                self.dropped += 1
+                if item[1] is not None:
+                    item[1]()
+
+    def _write_batch(
+        self,
+        batch: list[tuple[T, Callable[[], None] | None]],
+        write_batch: Callable[[list[T]], None] | None,
+    ) -> None:
+        """Write drained items, then give them back to their producers."""
+        written = self.written
+        try:
+            if write_batch is not None and len(batch) > 1:
+                write_batch([data for data, _ in batch])
+                self.written += len(batch)
+            else:
+                for data, _ in batch:
+                    self.writer.write(data)
+                    self.written += 1
+        finally:
+            for _, release in batch:
+                if release is not None:
+                    release()
+
+        # Fire progress callback every 10 datas
+        if self.written // 10 != written // 10:
+            try:
+                self._on_progress(self.written, self.queued)
+            except Exception as e:
+                print(f"Error in progress callback: {e}")
+
     def _process_loop(self) -> None:
         """Process datas from queue in background thread."""
+        if self.cpus and hasattr(os, "sched_setaffinity"):
+            try:
+                # pid 0 is the calling thread
+                os.sched_setaffinity(0, self.cpus)
+            except OSError as e:
+                print(f"Warning: Failed to pin BackgroundWriter thread: {e}")
+
+        # Writers implementing BatchWriter take a drained backlog in one call
+        write_batch = getattr(self.writer, "write_batch", None)
+        batch: list[tuple[T, Callable[[], None] | None]] = []
+        eos = False
         try:
-            while True:
+            while not eos:
+                # Drain everything already queued in one pass, so a backlog
+                # costs one wakeup and, if supported, one batched write
                 try:
-                    data = self.queue.get(timeout=0.1)
-
-                    # Check for EOS
-                    if data is None:
-                        break
-
-                    # Write data to underlying writer
-                    self.writer.write(data)
-                    self.written += 1
-                    self.queue.task_done()
-
-                    # Fire progress callback every 10 datas
-                    if self.written % 10 == 0:
-                        try:
-                            self._on_progress(self.written, self.queued)
-                        except Exception as e:
-                            print(f"Error in progress callback: {e}")
-
-                except queue.Empty:
-                    if not self.active:
-                        break
+                    while len(batch) < _MAX_BATCH:
+                        item = self.queue.popleft()
+
+                        # Check for EOS
+                        if item is None:
+                            eos = True
+                            break
+                        batch.append(item)
+                except IndexError:
+                    pass
+
+                if batch:
+                    self._write_batch(batch, write_batch)
+                    batch.clear()
+                    continue
+                if eos:
+                    break
+
+                # Clear before re-checking so a write landing in between
+                # either is seen now or sets the event again. close()
+                # always queues EOS and sets it, so no timeout is needed
+                self._ready.clear()
+                if self.queue:
                     continue
+                if not self.active:
+                    break
+                self._ready.wait()
 
         except Exception as e:
             # Fire error callback
@@ -118,6 +228,13 @@ class BackgroundWriter[T](Closable[T]):
                 print(f"Error in error callback: {callback_error}")
             print(f"Error in BackgroundWriter processing loop: {e}")
         finally:
+            # Stop taking writes and hand back whatever was left behind, so
+            # every release still runs exactly once even after an error.
+            # Writes racing this see _stopped and drain their own items
+            self.active = False
+            self._stopped = True
+            self._release_pending()
+
             # Close underlying writer
             try:
                 self.writer.close()
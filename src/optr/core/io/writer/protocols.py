@@ -1,5 +1,6 @@
 """Writer protocols for the writer module."""
 
+from collections.abc import Sequence
 from typing import Protocol, TypeVar
 
 from optr.core.io.protocols import Closer
@@ -15,6 +16,14 @@ class Writer(Protocol[T]):
         ...
 
 
+class BatchWriter[T](Writer[T], Protocol):
+    """A writer that can also take several items in one call."""
+
+    def write_batch(self, items: Sequence[T]) -> None:
+        """Write items in order, as if by repeated write()."""
+        ...
+
+
 class Closable[T](Writer[T], Closer, Protocol):
     """A protocol for objects that can be written to and closed."""
 
@@ -1,7 +1,10 @@
+import os
 import tempfile
 import threading
 from pathlib import Path
 
+import pytest
+
 from .background import BackgroundWriter
 from .protocols import Closable
 
@@ -47,6 +50,25 @@ class FailingWriter(MockWriter):
         super().write(data)
 
 
+class BatchWriter(MockWriter):
+    """Writer that also accepts batches, gated until released."""
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        self.batches: list[list[bytes]] = []
+        self.busy = threading.Event()
+        self.gate = threading.Event()
+
+    def write(self, data: bytes) -> None:
+        self.busy.set()
+        self.gate.wait(timeout=1.0)
+        super().write(data)
+
+    def write_batch(self, items: list[bytes]) -> None:
+        self.batches.append(items)
+        self.writes.extend(items)
+
+
 class CopyableData:
     """Data that supports copying."""
 
@@ -76,6 +98,17 @@ class TestBackgroundWriter:
         assert mock.writes[0] == b"test"
         assert mock.closed
 
+    def test_close_idle_writer(self):
+        """Closing an idle writer stops its daemon worker right away."""
+        mock = MockWriter(self.path)
+        writer = BackgroundWriter(mock)
+        assert writer.thread.daemon
+
+        writer.close()
+
+        assert not writer.thread.is_alive()
+        assert mock.closed
+
     def test_write_ordering(self):
         """Multiple writes processed in order."""
         mock = MockWriter(self.path)
@@ -104,6 +137,63 @@ class TestBackgroundWriter:
         writer.close()
         assert len(mock.writes) == 1
 
+    def test_backlog_drained_as_batch(self):
+        """Items queued while the worker is busy reach write_batch together."""
+        mock = BatchWriter(self.path)
+        writer = BackgroundWriter(mock)
+
+        # First item blocks the worker so the rest pile up behind it
+        writer.write(b"first")
+        assert mock.busy.wait(timeout=1.0)
+        for i in range(5):
+            writer.write(f"item-{i}".encode())
+        mock.gate.set()
+        writer.close()
+
+        assert mock.writes == [b"first"] + [f"item-{i}".encode() for i in range(5)]
+        assert [f"item-{i}".encode() for i in range(5)] in mock.batches
+        assert writer.written == 6
+
+    def test_capacity_drops_overflow(self):
+        """Writes beyond capacity are dropped, counted and released."""
+        mock = BatchWriter(self.path)
+        writer = BackgroundWriter(mock, capacity=2)
+
+        writer.write(b"first")
+        assert mock.busy.wait(timeout=1.0)
+        released = []
+        for i in range(4):
+            writer.write(f"item-{i}".encode(), release=lambda i=i: released.append(i))
+
+        # Dropped items are handed back before anything is written
+        assert released == [2, 3]
+        assert writer.dropped == 2
+
+        mock.gate.set()
+        writer.close()
+
+        assert mock.writes == [b"first", b"item-0", b"item-1"]
+        assert released == [2, 3, 0, 1]
+
+    @pytest.mark.skipif(
+        not hasattr(os, "sched_getaffinity"), reason="CPU affinity is Linux only"
+    )
+    def test_pins_thread_to_cpus(self):
+        """Worker thread runs on the requested CPUs."""
+        cpu = min(os.sched_getaffinity(0))
+        seen = []
+
+        class AffinityWriter(MockWriter):
+            def write(self, data: bytes) -> None:
+                seen.append(os.sched_getaffinity(0))
+                super().write(data)
+
+        writer = BackgroundWriter(AffinityWriter(self.path), cpus={cpu})
+        writer.write(b"test")
+        writer.close()
+
+        assert seen == [{cpu}]
+
     def test_thread_safety(self):
         """Concurrent writes work correctly."""
         mock = MockWriter(self.path)
@@ -166,6 +256,39 @@ class TestBackgroundWriter:
         assert len(error_caught) == 1
         assert isinstance(error_caught[0], RuntimeError)
 
+    def test_failure_releases_pending_items(self):
+        """Items left queued or written after a failure are still released."""
+
+        busy = threading.Event()
+        gate = threading.Event()
+
+        class GatedFailingWriter(MockWriter):
+            def write(self, data: bytes) -> None:
+                busy.set()
+                gate.wait(timeout=1.0)
+                raise RuntimeError("write failed")
+
+        mock = GatedFailingWriter(self.path)
+        writer = BackgroundWriter(mock)
+        released = []
+
+        writer.write(b"first", release=lambda: released.append("first"))
+        assert busy.wait(timeout=1.0)
+        for name in ("a", "b", "c"):
+            writer.write(name.encode(), release=lambda n=name: released.append(n))
+
+        gate.set()
+        writer.thread.join(timeout=1.0)
+        assert not writer.thread.is_alive()
+        assert released == ["first", "a", "b", "c"]
+
+        # Later writes are dropped and handed straight back
+        writer.write(b"late", release=lambda: released.append("late"))
+        assert released[-1] == "late"
+        assert writer.dropped == 4
+        assert len(writer.queue) == 0
+        writer.close()
+
     def test_complete_callback(self):
         """Complete callback fires on close."""
         mock = MockWriter(self.path)
@@ -182,18 +305,31 @@ class TestBackgroundWriter:
         assert len(completed) == 1
 
     def test_data_copy(self):
-        """Data with copy method gets copied."""
+        """write_copy queues a copy of data with copy method."""
         mock = MockWriter(self.path)
         writer = BackgroundWriter(mock)
 
         original = CopyableData("test")
-        writer.write(original)
+        writer.write_copy(original)
         writer.close()
 
         written = mock.writes[0]
         assert written.value == "test"
         assert written is not original
 
+    def test_write_hands_off(self):
+        """write queues the object itself and releases it after writing."""
+        mock = MockWriter(self.path)
+        writer = BackgroundWriter(mock)
+
+        original = CopyableData("test")
+        released = []
+        writer.write(original, release=lambda: released.append(len(mock.writes)))
+        writer.close()
+
+        assert mock.writes[0] is original
+        assert released == [1]
+
     def test_data_passthrough(self):
         """Data without copy method passed through."""
         mock = MockWriter(self.path)
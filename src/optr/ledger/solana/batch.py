@@ -8,6 +8,8 @@ from typing import Any
 
 import msgpack
 
+from .serialize import EMPTY_ROOT, hash_leaf, hash_pair
+
 
 @dataclass
 class BatchConfig:
@@ -50,7 +52,7 @@ class ActionBatch:
             max_size: Max actions per batch
             max_bytes: Max bytes per batch
             timeout: Flush after N seconds
-            compression: Compression method (msgpack, json, none)
+            compression: Compression method (msgpack, zstd, json, none)
         """
         self.config = BatchConfig(
             max_size=max_size,
@@ -61,6 +63,8 @@ class ActionBatch:
         self.actions: list[dict[str, Any]] = []
         self.start_time: float | None = None
         self.total_bytes: int = 0
+        # Roots of complete subtrees, one slot per level (None when empty)
+        self._frontier: list[bytes | None] = []
 
     def add(self, action: dict[str, Any]) -> None:
         """
@@ -82,6 +86,39 @@ class ActionBatch:
 
         self.actions.append(action)
         self.total_bytes += action_bytes
+        self._push_leaf(hash_leaf(action))
+
+    def _push_leaf(self, node: bytes) -> None:
+        """Merge a new leaf into the frontier, carrying like a binary counter"""
+        for level, left in enumerate(self._frontier):
+            if left is None:
+                self._frontier[level] = node
+                return
+            node = hash_pair(left, node)
+            self._frontier[level] = None
+        self._frontier.append(node)
+
+    def root(self) -> str:
+        """
+        Get merkle root of current batch in O(log n)
+
+        Returns:
+            Same hash as merkle_root(batch.actions)
+        """
+        top = self._frontier[-1] if self._frontier else None
+        if top is None:
+            return EMPTY_ROOT
+
+        # Fold frontier bottom-up; a lone node at any level is paired with
+        # itself, matching merkle_root's odd-level padding
+        carry: bytes | None = None
+        for node in self._frontier[:-1]:
+            if node is not None:
+                carry = hash_pair(node, node if carry is None else carry)
+            elif carry is not None:
+                carry = hash_pair(carry, carry)
+
+        return (top if carry is None else hash_pair(top, carry)).decode()
 
     def should_flush(self) -> bool:
         """
@@ -120,6 +157,7 @@ class ActionBatch:
         self.actions = []
         self.start_time = None
         self.total_bytes = 0
+        self._frontier = []
         return actions
 
     def compress(self) -> bytes:
@@ -134,6 +172,19 @@ class ActionBatch:
 
         if self.config.compression == "msgpack":
             return msgpack.packb(self.actions)
+        elif self.config.compression == "zstd":
+            # msgpack framed in zstd; a whole batch gives zstd enough
+            # repeated keys to match on, unlike a single action
+            try:
+                import zstandard
+            except ImportError as e:
+                raise ImportError(
+                    "Install solana package: pip install 'optr[solana]'"
+                ) from e
+
+            return zstandard.ZstdCompressor(level=3).compress(
+                msgpack.packb(self.actions)
+            )
         elif self.config.compression == "json":
             import json
 
@@ -155,6 +206,7 @@ class ActionBatch:
         self.actions = []
         self.start_time = None
         self.total_bytes = 0
+        self._frontier = []
 
     def get_stats(self) -> dict[str, Any]:
         """
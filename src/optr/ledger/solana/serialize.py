@@ -4,12 +4,19 @@ Serialization and compression utilities for on-chain storage
 
 import hashlib
 import json
+from binascii import hexlify
 from typing import Any
 
 import msgpack
 
 from ...operator.action import Action
 
+# Root of an empty action list, hashed once at import
+EMPTY_ROOT = hashlib.sha256(b"").hexdigest()
+
+# Shared canonical encoder; json.dumps(sort_keys=True) builds a new one per call
+_canonical_json = json.JSONEncoder(sort_keys=True).encode
+
 
 def compress_action(action: Action | dict[str, Any]) -> bytes:
     """
@@ -66,7 +73,7 @@ def hash_action(action: Action | dict[str, Any]) -> str:
     """
     # Action is now a TypedDict, which is just a dict at runtime
     # Ensure consistent ordering
-    json_str = json.dumps(action, sort_keys=True)
+    json_str = _canonical_json(action)
     return hashlib.sha256(json_str.encode()).hexdigest()
 
 
@@ -85,27 +92,82 @@ def merkle_root(actions: list[Action | dict[str, Any]]) -> str:
         # Store root on-chain for batch verification
     """
     if not actions:
-        return hashlib.sha256(b"").hexdigest()
+        return EMPTY_ROOT
+
+    # Leaf hashes are kept as ASCII hex bytes so each level can be
+    # concatenated and hashed without str/bytes round-trips. Runs of the
+    # same action object share one leaf, so the runs collapse level by level
+    level: list[bytes] = []
+    previous: object = None
+    leaf = b""
+    for action in actions:
+        if action is not previous:
+            previous = action
+            leaf = hash_leaf(action)
+        level.append(leaf)
+
+    # Build merkle tree one level at a time
+    while len(level) > 1:
+        level = _reduce_level(level)
+
+    return level[0].decode()
+
+
+def hash_leaf(action: Action | dict[str, Any]) -> bytes:
+    """
+    Hash an action into a hex-encoded merkle leaf
+
+    Args:
+        action: Action to hash
+
+    Returns:
+        ASCII hex digest, same value as hash_action
+    """
+    return hexlify(hashlib.sha256(_canonical_json(action).encode()).digest())
 
-    # Get leaf hashes
-    hashes = [hash_action(action) for action in actions]
 
-    # Build merkle tree
-    while len(hashes) > 1:
-        # Pad with last hash if odd number
-        if len(hashes) % 2 == 1:
-            hashes.append(hashes[-1])
+def hash_pair(left: bytes, right: bytes) -> bytes:
+    """
+    Hash two hex-encoded sibling nodes into their parent
 
-        # Combine pairs
-        new_hashes = []
-        for i in range(0, len(hashes), 2):
-            combined = hashes[i] + hashes[i + 1]
-            new_hash = hashlib.sha256(combined.encode()).hexdigest()
-            new_hashes.append(new_hash)
+    Args:
+        left: Left child digest
+        right: Right child digest
 
-        hashes = new_hashes
+    Returns:
+        ASCII hex digest of the parent node
+    """
+    return hexlify(hashlib.sha256(left + right).digest())
 
-    return hashes[0]
+
+def _reduce_level(level: list[bytes]) -> list[bytes]:
+    """
+    Hash all sibling pairs of a tree level in a single batched pass
+
+    Args:
+        level: Hex-encoded node hashes of the current level
+
+    Returns:
+        Hex-encoded node hashes of the parent level
+    """
+    # Pad with last hash if odd number
+    if len(level) % 2 == 1:
+        level = [*level, level[-1]]
+
+    # A pair identical to the previous one (a run of repeated subtrees,
+    # including odd-level padding) reuses its parent instead of rehashing.
+    # hashlib takes one message per call, so hashing windows of a contiguous
+    # level buffer saves nothing over the 128-byte concat and loses the reuse
+    sha256 = hashlib.sha256
+    parents: list[bytes] = []
+    prev_left = prev_right = parent = b""
+    for left, right in zip(level[0::2], level[1::2], strict=True):
+        if left is not prev_left or right is not prev_right:
+            prev_left, prev_right = left, right
+            parent = hexlify(sha256(left + right).digest())
+        parents.append(parent)
+
+    return parents
 
 
 def compress_state(state: dict[str, Any], include_visual: bool = False) -> bytes:
@@ -157,25 +219,19 @@ def create_action_proof(
         proof = create_action_proof(action, state1, state2)
         # Store proof on-chain for verification
     """
+    # Each component is hashed once and reused in the combined hash
+    action_hash = hash_action(action)
+    state_before_hash = hashlib.sha256(
+        _canonical_json(state_before).encode()
+    ).hexdigest()
+    state_after_hash = hashlib.sha256(_canonical_json(state_after).encode()).hexdigest()
+    combined = action_hash + state_before_hash + state_after_hash
+
     return {
-        "action_hash": hash_action(action),
-        "state_before_hash": hashlib.sha256(
-            json.dumps(state_before, sort_keys=True).encode()
-        ).hexdigest(),
-        "state_after_hash": hashlib.sha256(
-            json.dumps(state_after, sort_keys=True).encode()
-        ).hexdigest(),
-        "combined_hash": hashlib.sha256(
-            (
-                hash_action(action)
-                + hashlib.sha256(
-                    json.dumps(state_before, sort_keys=True).encode()
-                ).hexdigest()
-                + hashlib.sha256(
-                    json.dumps(state_after, sort_keys=True).encode()
-                ).hexdigest()
-            ).encode()
-        ).hexdigest(),
+        "action_hash": action_hash,
+        "state_before_hash": state_before_hash,
+        "state_after_hash": state_after_hash,
+        "combined_hash": hashlib.sha256(combined.encode()).hexdigest(),
     }
 
 
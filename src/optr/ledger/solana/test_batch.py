@@ -0,0 +1,69 @@
+"""Focused test suite for ActionBatch."""
+
+import msgpack
+import pytest
+
+from .batch import ActionBatch
+from .serialize import merkle_root
+
+
+def make_actions(count: int) -> list[dict]:
+    return [{"type": "click", "x": i, "y": i * 2} for i in range(count)]
+
+
+class TestActionBatchRoot:
+    """Incremental merkle root tests."""
+
+    def test_empty_batch_root(self):
+        """Empty batch has the empty merkle root."""
+        assert ActionBatch().root() == merkle_root([])
+
+    def test_root_matches_merkle_root_after_each_add(self):
+        """Incremental root equals full rebuild at every size."""
+        batch = ActionBatch(max_size=100, max_bytes=1_000_000)
+        for action in make_actions(70):
+            batch.add(action)
+            assert batch.root() == merkle_root(batch.actions)
+
+    def test_rejected_action_does_not_change_root(self):
+        """Actions refused by the byte limit are not hashed."""
+        batch = ActionBatch(max_bytes=40)
+        batch.add({"type": "click", "x": 1, "y": 2})
+        root = batch.root()
+
+        batch.add({"type": "type", "text": "x" * 100})
+
+        assert batch.size() == 1
+        assert batch.root() == root
+
+    def test_flush_and_clear_reset_root(self):
+        """Flushing or clearing starts a fresh tree."""
+        batch = ActionBatch(max_bytes=1_000_000)
+        for action in make_actions(5):
+            batch.add(action)
+        batch.flush()
+        assert batch.root() == merkle_root([])
+
+        for action in make_actions(3):
+            batch.add(action)
+        assert batch.root() == merkle_root(make_actions(3))
+
+        batch.clear()
+        assert batch.root() == merkle_root([])
+
+
+class TestActionBatchCompress:
+    """Batch compression tests."""
+
+    def test_zstd_round_trip(self):
+        """zstd batches decompress back to the msgpack payload."""
+        zstandard = pytest.importorskip("zstandard")
+        batch = ActionBatch(max_bytes=1_000_000, compression="zstd")
+        for action in make_actions(20):
+            batch.add(action)
+
+        compressed = batch.compress()
+
+        assert len(compressed) < len(msgpack.packb(batch.actions))
+        payload = zstandard.ZstdDecompressor().decompress(compressed)
+        assert msgpack.unpackb(payload) == batch.actions
@@ -0,0 +1,82 @@
+"""Focused test suite for Solana serialization utilities."""
+
+import hashlib
+import json
+
+import pytest
+
+from .serialize import create_action_proof, hash_action, merkle_root
+
+
+def reference_root(actions: list[dict]) -> str:
+    """Straightforward merkle root used as the expected value."""
+    if not actions:
+        return hashlib.sha256(b"").hexdigest()
+
+    hashes = [hash_action(action) for action in actions]
+    while len(hashes) > 1:
+        if len(hashes) % 2 == 1:
+            hashes.append(hashes[-1])
+        hashes = [
+            hashlib.sha256((hashes[i] + hashes[i + 1]).encode()).hexdigest()
+            for i in range(0, len(hashes), 2)
+        ]
+    return hashes[0]
+
+
+def make_actions(count: int) -> list[dict]:
+    return [{"type": "click", "x": i, "y": i * 2} for i in range(count)]
+
+
+class TestMerkleRoot:
+    """Merkle root correctness tests."""
+
+    def test_empty_list(self):
+        """Empty action list hashes the empty string."""
+        assert merkle_root([]) == hashlib.sha256(b"").hexdigest()
+
+    def test_single_action_is_leaf_hash(self):
+        """Single action root equals its leaf hash."""
+        action = {"type": "type", "text": "hello"}
+        assert merkle_root([action]) == hash_action(action)
+
+    @pytest.mark.parametrize("count", [2, 3, 4, 5, 7, 8, 9, 33, 100])
+    def test_matches_reference(self, count):
+        """Root matches the reference tree for even and odd sizes."""
+        actions = make_actions(count)
+        assert merkle_root(actions) == reference_root(actions)
+
+    def test_order_sensitive(self):
+        """Reordering actions changes the root."""
+        actions = make_actions(4)
+        assert merkle_root(actions) != merkle_root(actions[::-1])
+
+    @pytest.mark.parametrize("count", [2, 5, 64, 100])
+    def test_repeated_action_runs(self, count):
+        """Runs of the same action object match the reference tree."""
+        noop = {"type": "wait", "duration": 0.0}
+        actions = [noop] * count + make_actions(3) + [noop] * count
+        assert merkle_root(actions) == reference_root(actions)
+
+
+class TestActionProof:
+    """Action proof tests."""
+
+    def test_proof_hashes(self):
+        """Proof components and combined hash match direct SHA-256 of JSON."""
+        action = {"type": "click", "x": 1, "y": 2}
+        before = {"timestamp": 1.0, "metadata": {"b": 1, "a": 2}}
+        after = {"timestamp": 2.0, "metadata": {}}
+
+        def digest(value: dict) -> str:
+            return hashlib.sha256(
+                json.dumps(value, sort_keys=True).encode()
+            ).hexdigest()
+
+        expected = digest(action) + digest(before) + digest(after)
+        assert create_action_proof(action, before, after) == {
+            "action_hash": digest(action),
+            "state_before_hash": digest(before),
+            "state_after_hash": digest(after),
+            "combined_hash": hashlib.sha256(expected.encode()).hexdigest(),
+        }
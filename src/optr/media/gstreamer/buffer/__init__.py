@@ -4,18 +4,28 @@ from .core import (
     copy_metadata,
     info,
     pull,
+    pull_into,
     push,
+    push_list,
     read,
+    read_into,
     set_timestamp,
     write,
 )
+from .pool import FrameRing, frame_pool, query_allocator
 
 __all__ = [
     "write",
     "read",
+    "read_into",
     "push",
+    "push_list",
     "pull",
+    "pull_into",
     "set_timestamp",
     "info",
     "copy_metadata",
+    "frame_pool",
+    "query_allocator",
+    "FrameRing",
 ]
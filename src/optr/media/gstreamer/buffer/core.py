@@ -1,14 +1,40 @@
 """Core buffer operations for GStreamer - bytes focused."""
 
-from gi.repository import Gst
+from collections.abc import Buffer, Iterable
+
+import gi
+
+gi.require_version("Gst", "1.0")
+gi.require_version("GstApp", "1.0")
+
+# Loading GstApp makes appsrc/appsink elements wrap as GstApp.AppSrc and
+# GstApp.AppSink, whose methods push() and pull() call directly
+from gi.repository import GLib, Gst, GstApp  # noqa: E402, F401
 
 
 def write(
-    data: bytes, timestamp_ns: int = 0, duration_ns: int | None = None
+    data: Buffer,
+    timestamp_ns: int = 0,
+    duration_ns: int | None = None,
+    pool: Gst.BufferPool | None = None,
 ) -> Gst.Buffer:
-    """Create a Gst.Buffer from bytes data."""
-    buf = Gst.Buffer.new_allocate(None, len(data), None)
-    buf.fill(0, data)
+    """Create a Gst.Buffer from bytes-like data (bytes, ndarray, memoryview).
+
+    With `pool`, the data is copied into a buffer acquired from it.
+    """
+    if pool is not None:
+        ret, buf = pool.acquire_buffer(None)
+        if ret != Gst.FlowReturn.OK:
+            raise RuntimeError(f"Failed to acquire buffer from pool: {ret}")
+        _fill(buf, data)
+    elif isinstance(data, bytes):
+        # One copy into a refcounted GBytes that the buffer wraps, instead of
+        # allocating Gst memory and filling it through a second call
+        buf = Gst.Buffer.new_wrapped_bytes(GLib.Bytes.new(data))
+    else:
+        buf = Gst.Buffer.new_allocate(None, memoryview(data).nbytes, None)
+        _fill(buf, data)
+
     buf.pts = timestamp_ns
     buf.dts = timestamp_ns
     if duration_ns is not None:
@@ -16,6 +42,22 @@ def write(
     return buf
 
 
+def _fill(buf: Gst.Buffer, data: Buffer) -> None:
+    """Copy data into buf, which must be exactly data-sized."""
+    # Copies straight out of the exporter's memory (must be C-contiguous);
+    # avoids the tobytes() copy a bytes-only API would force on callers
+    view = memoryview(data).cast("B")
+    ok, info = buf.map(Gst.MapFlags.WRITE)
+    if not ok:
+        raise RuntimeError("Failed to map buffer for WRITE")
+    try:
+        if info.size != len(view):
+            raise ValueError(f"Data of {len(view)} bytes does not fill {info.size}")
+        info.data[:] = view
+    finally:
+        buf.unmap(info)
+
+
 def read(buffer: Gst.Buffer) -> bytes:
     """Extract bytes data from a Gst.Buffer."""
     ok, info = buffer.map(Gst.MapFlags.READ)
@@ -30,20 +72,53 @@ def read(buffer: Gst.Buffer) -> bytes:
     return data
 
 
+def read_into(buffer: Gst.Buffer, out: Buffer) -> int:
+    """Copy Gst.Buffer data into a writable buffer (bytearray, ndarray, ...).
+
+    Single memcpy from the mapped memory, no intermediate bytes object.
+    Returns the number of bytes copied.
+    """
+    ok, info = buffer.map(Gst.MapFlags.READ)
+    if not ok:
+        raise RuntimeError("Failed to map buffer for READ")
+
+    try:
+        size = info.size
+        view = memoryview(out).cast("B")
+        if size > len(view):
+            raise ValueError(f"Buffer of {size} bytes does not fit into {len(view)}")
+        view[:size] = info.data
+    finally:
+        buffer.unmap(info)
+
+    return size
+
+
 def push(
     appsrc: Gst.Element,
-    data: bytes,
+    data: Buffer,
     timestamp_ns: int = 0,
     duration_ns: int | None = None,
+    pool: Gst.BufferPool | None = None,
 ) -> Gst.FlowReturn:
-    """Push bytes data to appsrc."""
-    buf = write(data, timestamp_ns, duration_ns)
-    return appsrc.emit("push-buffer", buf)
+    """Push bytes-like data to appsrc."""
+    buf = write(data, timestamp_ns, duration_ns, pool)
+    # Direct GstApp.AppSrc method call, no GObject signal dispatch
+    return appsrc.push_buffer(buf)
+
+
+def push_list(appsrc: Gst.Element, buffers: Iterable[Gst.Buffer]) -> Gst.FlowReturn:
+    """Push several buffers to appsrc in one call."""
+    buflist = Gst.BufferList.new()
+    for buf in buffers:
+        buflist.insert(-1, buf)
+    return appsrc.push_buffer_list(buflist)
 
 
 def pull(appsink: Gst.Element, timeout_ns: int = Gst.SECOND) -> bytes | None:
     """Pull bytes data from appsink."""
-    sample = appsink.emit("try-pull-sample", timeout_ns)
+    # Direct GstApp.AppSink method call, no GObject signal dispatch
+    sample = appsink.try_pull_sample(timeout_ns)
     if not sample:
         return None
 
@@ -57,6 +132,26 @@ def pull(appsink: Gst.Element, timeout_ns: int = Gst.SECOND) -> bytes | None:
             pass
 
 
+def pull_into(
+    appsink: Gst.Element, out: Buffer, timeout_ns: int = Gst.SECOND
+) -> int | None:
+    """Pull a sample from appsink straight into a preallocated buffer.
+
+    Returns bytes copied, or None on timeout/EOS.
+    """
+    sample = appsink.try_pull_sample(timeout_ns)
+    if not sample:
+        return None
+
+    try:
+        return read_into(sample.get_buffer(), out)
+    finally:
+        try:
+            sample.unref()
+        except Exception:
+            pass
+
+
 def set_timestamp(
     buffer: Gst.Buffer,
     pts_ns: int,
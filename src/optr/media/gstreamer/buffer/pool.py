@@ -1,7 +1,9 @@
 """Buffer pooling for efficient memory management."""
 
+import math
 from typing import Any
 
+import numpy as np
 from gi.repository import Gst
 
 
@@ -49,3 +51,72 @@ class BufferPool:
             "buffer_sizes": list(self.pools.keys()),
             "buffers_per_size": {size: len(pool) for size, pool in self.pools.items()},
         }
+
+
+def query_allocator(
+    pad: Gst.Pad, caps: Gst.Caps
+) -> tuple[Gst.Allocator | None, Gst.AllocationParams | None]:
+    """Ask downstream of pad which allocator it wants buffers for caps from."""
+    query = Gst.Query.new_allocation(caps, True)
+    if not pad.peer_query(query) or query.get_n_allocation_params() == 0:
+        return None, None
+    allocator, params = query.parse_nth_allocation_param(0)
+    return allocator, params
+
+
+def frame_pool(
+    caps: Gst.Caps,
+    size: int,
+    min_buffers: int = 4,
+    max_buffers: int = 16,
+    allocator: Gst.Allocator | None = None,
+    params: Gst.AllocationParams | None = None,
+) -> Gst.BufferPool:
+    """Create an active Gst.BufferPool of fixed-size frame buffers.
+
+    Buffers acquired from it return to the pool once downstream drops
+    them, so constant-size frames reuse the same memory. `allocator`
+    (e.g. from query_allocator) backs them with downstream's memory type.
+    """
+    pool = Gst.BufferPool.new()
+    config = pool.get_config()
+    Gst.BufferPool.config_set_params(config, caps, size, min_buffers, max_buffers)
+    if allocator is not None:
+        Gst.BufferPool.config_set_allocator(config, allocator, params)
+    if not pool.set_config(config) or not pool.set_active(True):
+        raise RuntimeError(f"Failed to configure buffer pool for {caps.to_string()}")
+    return pool
+
+
+class FrameRing:
+    """Ring of preallocated frame arrays for allocation-free pulls.
+
+    Example:
+        ring = buffer.FrameRing(width * height * 3, shape=(height, width, 3))
+        frame = ring.next()
+        size = buffer.pull_into(appsink, frame)
+
+    Each slot is a uint8 ndarray created once, so pulled frames are usable
+    as arrays without wrapping them in a new ndarray per frame. A frame is
+    overwritten after `count` further calls to next(), so consume or copy
+    it before the ring wraps.
+    """
+
+    def __init__(
+        self, frame_size: int, count: int = 4, shape: tuple[int, ...] | None = None
+    ):
+        if shape is None:
+            shape = (frame_size,)
+        elif math.prod(shape) != frame_size:
+            raise ValueError(f"Shape {shape} does not hold {frame_size} bytes")
+
+        self.frame_size = frame_size
+        self.shape = shape
+        self.frames = [np.empty(shape, dtype=np.uint8) for _ in range(count)]
+        self._index = 0
+
+    def next(self) -> np.ndarray:
+        """Get the next frame array in the ring."""
+        frame = self.frames[self._index]
+        self._index = (self._index + 1) % len(self.frames)
+        return frame
@@ -1,10 +1,15 @@
 from collections.abc import Mapping
 from typing import Required, TypedDict, Unpack
 
-from gi.repository import Gst
+import gi
 
 from optr.media.fps import FPS
 
+gi.require_version("Gst", "1.0")
+gi.require_version("GstVideo", "1.0")
+
+from gi.repository import Gst, GstVideo  # noqa: E402
+
 
 def create(type: str, props: Mapping[str, object] | None = None) -> Gst.Caps:
     """Create GStreamer caps from type and properties."""
@@ -53,3 +58,11 @@ def rtp(**props: Unpack[RTP]) -> Gst.Caps:
     props.setdefault("clock_rate", 90000)
 
     return create("application/x-rtp", props)
+
+
+def frame_size(caps: Gst.Caps) -> int:
+    """Size in bytes of one raw video frame for caps, including row padding."""
+    info = GstVideo.VideoInfo.new_from_caps(caps)
+    if info is None:
+        raise ValueError(f"Not raw video caps: {caps.to_string()}")
+    return info.size
@@ -9,7 +9,9 @@ class AppSrc(TypedDict, total=False):
     caps: Required[Gst.Caps]
     format: Literal["time", "bytes", "buffers"] | Gst.Format
     max_buffers: int
+    max_bytes: int
     block: bool
+    leaky_type: Literal["none", "upstream", "downstream"]
     emit_signals: bool
     is_live: bool
     do_timestamp: bool
@@ -1,15 +1,31 @@
 from collections.abc import Mapping
+from functools import cache
 
 from gi.repository import Gst
 
 from ..errors import ElementCreationError, PropertyError
 
+# Registry lookups are done once per element type. Misses are not cached:
+# the element may be registered later (plugin load, Python element)
+_factories: dict[str, Gst.ElementFactory] = {}
+
+
+@cache
+def _dashify(prop: str) -> str:
+    return prop.replace("_", "-")
+
 
 def create(
     type: str, /, props: Mapping[str, object] | None = None, name: str | None = None
 ) -> Gst.Element:
     """Generic element creator with property management."""
-    element = Gst.ElementFactory.make(type, name)
+    factory = _factories.get(type)
+    if factory is None:
+        factory = Gst.ElementFactory.find(type)
+        if factory is not None:
+            _factories[type] = factory
+
+    element = factory.create(name) if factory is not None else None
 
     if not element:
         raise ElementCreationError(type, name)
@@ -17,11 +33,13 @@ def create(
     if not props:
         return element
 
-    for prop, value in props.items():
-        prop_name = prop.replace("_", "-")
-        try:
-            element.set_property(prop_name, value)
-        except Exception as e:
-            raise PropertyError(type, prop_name, value, e) from e
+    # Queue notify:: emissions and flush them once, as g_object_setv does
+    with element.freeze_notify():
+        for prop, value in props.items():
+            prop_name = _dashify(prop)
+            try:
+                element.set_property(prop_name, value)
+            except Exception as e:
+                raise PropertyError(type, prop_name, value, e) from e
 
     return element
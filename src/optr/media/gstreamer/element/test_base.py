@@ -0,0 +1,43 @@
+"""Focused tests for the generic element creator."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ..errors import ElementCreationError
+from . import base
+
+
+class TestCreate:
+    """Factory lookup caching tests."""
+
+    def setup_method(self):
+        base._factories.clear()
+
+    def teardown_method(self):
+        base._factories.clear()
+
+    def test_missing_factory_found_after_registration(self):
+        """A failed lookup is retried, so later registrations are picked up."""
+        factory = Mock()
+        with patch.object(
+            base.Gst.ElementFactory, "find", side_effect=[None, factory]
+        ) as find:
+            with pytest.raises(ElementCreationError):
+                base.create("latecomer")
+
+            # Registered since the first lookup
+            assert base.create("latecomer") is factory.create.return_value
+            assert find.call_count == 2
+
+    def test_found_factory_is_cached(self):
+        """Successful lookups hit the registry only once."""
+        factory = Mock()
+        with patch.object(
+            base.Gst.ElementFactory, "find", return_value=factory
+        ) as find:
+            base.create("cached")
+            base.create("cached", name="second")
+
+        assert find.call_count == 1
+        factory.create.assert_called_with("second")
@@ -4,6 +4,9 @@ from collections.abc import Sequence
 
 from gi.repository import Gst
 
+from ..element.processing import queue
+from .core import link
+
 
 def branch(tee: Gst.Element, *branches: Sequence[Gst.Element]) -> list[Gst.Element]:
     """
@@ -21,8 +24,6 @@ def branch(tee: Gst.Element, *branches: Sequence[Gst.Element]) -> list[Gst.Eleme
             "Provided element does not have 'src_%u' request pad template (not a tee?)"
         )
 
-    from ..element.processing import queue  # your queue() factory
-
     created_queues: list[Gst.Element] = []
     for branch_elems in branches:
         q = queue()
@@ -49,8 +50,6 @@ def branch(tee: Gst.Element, *branches: Sequence[Gst.Element]) -> list[Gst.Eleme
                 parent.add(e)
 
         # Link queue to branch elements
-        from .core import link
-
         if branch_elems and not link(q, *branch_elems):
             raise RuntimeError("Failed to link downstream branch after queue")
 
@@ -1,5 +1,7 @@
 """Core pipeline creation and composition utilities."""
 
+from itertools import pairwise
+
 from gi.repository import Gst
 
 
@@ -17,7 +19,9 @@ def pipeline(*elements: Gst.Element, name: str | None = None) -> Gst.Pipeline:
 
 def link(*elements: Gst.Element) -> bool:
     """Link elements in sequence."""
-    for a, b in zip(elements, elements[1:], strict=False):
+    # Gst.Element.link_many is a Python override doing this same loop (and
+    # raising instead of returning False), so it saves no C crossings here
+    for a, b in pairwise(elements):
         if not a.link(b):
             return False
     return True
@@ -37,16 +41,15 @@ def compose(*pipes: Gst.Pipeline, name: str | None = None) -> Gst.Pipeline:
     for p in pipes:
         p.set_state(Gst.State.NULL)
 
-        it = p.iterate_elements()
+        # Collect in one foreach call; the iterator is driven from C. A
+        # concurrent bin change stops it with RESYNC and a partial list
         elems: list[Gst.Element] = []
-        while True:
-            res, el = it.next()
-            if res == Gst.IteratorResult.OK:
-                elems.append(el)
-            elif res == Gst.IteratorResult.DONE:
-                break
-            elif res == Gst.IteratorResult.ERROR:
-                raise RuntimeError("Error iterating pipeline elements")
+        it = p.iterate_elements()
+        while (res := it.foreach(elems.append)) == Gst.IteratorResult.RESYNC:
+            it.resync()
+            elems.clear()
+        if res == Gst.IteratorResult.ERROR:
+            raise RuntimeError("Error iterating pipeline elements")
 
         for el in elems:
             p.remove(el)
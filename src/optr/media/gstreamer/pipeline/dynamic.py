@@ -2,6 +2,9 @@
 
 from gi.repository import Gst
 
+from ..element.processing import queue
+from .core import link
+
 
 def hot_add(pipeline: Gst.Pipeline, *elements: Gst.Element) -> bool:
     """Add elements to a running pipeline and sync their state."""
@@ -226,9 +229,6 @@ def branch_insert(
     if not branch_elements:
         return None
 
-    # Import queue from element module
-    from ..element.processing import queue
-
     # Create intermediate queue
     q = queue()
     if not hot_add(parent, q):
@@ -250,8 +250,6 @@ def branch_insert(
         return None
 
     # Link queue to branch elements
-    from ..pipeline import link
-
     if not link(q, *branch_elements):
         return None
 
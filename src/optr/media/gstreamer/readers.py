@@ -1,3 +1,5 @@
+from collections.abc import Buffer
+
 from gi.repository import Gst
 
 from optr.core.io.protocols import Closer, Reader
@@ -6,6 +8,17 @@ from optr.media.fps import FPS
 from . import buffer, caps, control, element, pipeline
 
 
+def _converted_appsink(format: str | None) -> Gst.Element:
+    """Appsink that makes the upstream videoconvert emit `format` (e.g. "RGB").
+
+    Pixel conversion then runs in videoconvert's SIMD paths instead of
+    being done on the returned frames in Python.
+    """
+    if format is None:
+        return element.appsink()
+    return element.appsink(caps=caps.create("video/x-raw", {"format": format}))
+
+
 class VideoReader(Reader[bytes], Closer):
     """Base video reader implementing Reader and Closer protocols."""
 
@@ -24,6 +37,16 @@ class VideoReader(Reader[bytes], Closer):
             self.eos = True
         return frame
 
+    def read_into(self, out: Buffer) -> int | None:
+        """Read next frame into a preallocated buffer, returns bytes copied."""
+        if self.eos:
+            return None
+
+        size = buffer.pull_into(self.appsink, out, timeout_ns=Gst.CLOCK_TIME_NONE)
+        if size is None:
+            self.eos = True
+        return size
+
     def close(self) -> None:
         """Close and cleanup resources."""
         control.play(self.pipe)
@@ -45,11 +68,11 @@ class SHMReader(VideoReader):
 class FileReader(VideoReader):
     """File reader with decoding."""
 
-    def __init__(self, filepath: str):
+    def __init__(self, filepath: str, format: str | None = None):
         src = element.filesrc(location=filepath)
         decoder = element.decodebin()
         convert = element.videoconvert()
-        sink = element.appsink()
+        sink = _converted_appsink(format)
 
         pipe = pipeline.pipeline(src, decoder, convert, sink, name="file-reader")
 
@@ -73,11 +96,11 @@ class FileReader(VideoReader):
 class RTMPReader(VideoReader):
     """RTMP stream reader."""
 
-    def __init__(self, url: str):
+    def __init__(self, url: str, format: str | None = None):
         src = element.rtmpsrc(location=url)
         decoder = element.decodebin()
         convert = element.videoconvert()
-        sink = element.appsink()
+        sink = _converted_appsink(format)
 
         pipe = pipeline.pipeline(src, decoder, convert, sink, name="rtmp-reader")
 
@@ -101,12 +124,12 @@ class RTMPReader(VideoReader):
 class UDPReader(VideoReader):
     """UDP stream reader."""
 
-    def __init__(self, host: str, port: int):
+    def __init__(self, host: str, port: int, format: str | None = None):
         src = element.udpsrc(host=host, port=port)
         depayloader = element.rtph264depay()
         decoder = element.avdec_h264()
         convert = element.videoconvert()
-        sink = element.appsink()
+        sink = _converted_appsink(format)
 
         pipe = pipeline.chain(
             src, depayloader, decoder, convert, sink, name="udp-reader"
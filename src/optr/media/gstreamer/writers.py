@@ -1,3 +1,7 @@
+import logging
+import time
+from collections.abc import Buffer, Sequence
+
 from gi.repository import Gst
 
 from optr.core.io.protocols import Closer, Writer
@@ -5,9 +9,25 @@ from optr.media.fps import FPS, ConvertibleToFPS
 
 from . import buffer, caps, control, element, pipeline
 
+logger = logging.getLogger(__name__)
+
+# Frames appsrc may hold when its buffer count is unbounded
+_MAX_QUEUED_FRAMES = 8
+
+# Raw formats x264enc takes directly, so appsrc can feed it unconverted
+_X264_FORMATS = frozenset({"I420", "YV12", "NV12", "Y42B", "Y444"})
+
+
+def _encoder_input(format: str) -> list[Gst.Element]:
+    """videoconvert in front of x264enc, unless `format` needs none."""
+    return [] if format in _X264_FORMATS else [element.videoconvert()]
+
 
 class VideoWriter(Writer[bytes], Closer):
-    """Base video writer implementing Writer and Closer protocols."""
+    """Base video writer implementing Writer and Closer protocols.
+
+    Unlocked single-producer design: write() must be called from one thread.
+    """
 
     def __init__(
         self,
@@ -15,46 +35,150 @@ class VideoWriter(Writer[bytes], Closer):
         appsrc: Gst.Element,
         fps: ConvertibleToFPS = 30,
         eos_timeout: float = 5.0,
+        leaky: bool = False,
     ):
+        """Wrap a pipeline fed through `appsrc`.
+
+        Unless the caller set max-bytes on appsrc, its queue is capped in
+        bytes from the frame size. With `leaky` (GStreamer 1.20+), a full
+        queue drops its oldest frames instead of growing or blocking.
+        """
         self.pipe = pipe
         self.appsrc = appsrc
         self.frame_count = 0
         [num, den] = FPS(fps)
-        # Calculate fps_ns from ConvertibleToFPS
-        self.fps_ns = (Gst.SECOND * den) // num
+        # Frame period as an exact fraction, so timestamps never drift
+        self._period = (Gst.SECOND * den, num)
         self.eos_timeout = eos_timeout
+        self.leaky = leaky
         self.started = False
+        self.pool: Gst.BufferPool | None = None
+        self.frame_size = 0
+        self.dropped = 0
+        self._dropped_logged_at = -1.0
+
+    def _create_pool(self) -> None:
+        """Pool frame buffers for fixed raw video caps.
+
+        Buffers come from the allocator downstream proposes, if any (e.g.
+        shmsink's shared memory), so the sink can forward them uncopied.
+        """
+        src_caps = self.appsrc.get_property("caps")
+        if src_caps is None or not src_caps.is_fixed():
+            return
+        try:
+            size = caps.frame_size(src_caps)
+        except ValueError:
+            return
+        allocator, params = buffer.query_allocator(
+            self.appsrc.get_static_pad("src"), src_caps
+        )
+        self.pool = buffer.frame_pool(
+            src_caps, size, allocator=allocator, params=params
+        )
+        self.frame_size = size
 
     def _start_pipeline(self) -> None:
         """Start the pipeline if not already started."""
         if not self.started:
             control.play(self.pipe)
             self.started = True
+            # Sinks set up their allocators on start, so query only now
+            self._create_pool()
+            self._bound_queue()
+
+    def _bound_queue(self) -> None:
+        """Cap appsrc's queue in bytes, now that the frame size is known."""
+        if not self.frame_size:
+            return
+
+        # Leave a max-bytes the caller chose alone
+        spec = self.appsrc.find_property("max-bytes")
+        if self.appsrc.get_property("max-bytes") == spec.default_value:
+            max_buffers = self.appsrc.get_property("max-buffers")
+            self.appsrc.set_property(
+                "max-bytes", self.frame_size * (max_buffers or _MAX_QUEUED_FRAMES)
+            )
+
+        if not self.leaky:
+            return
+        if Gst.version() < (1, 20):
+            logger.warning("appsrc leaky-type needs GStreamer 1.20+, not dropping")
+            return
+        self.appsrc.set_property("block", False)
+        self.appsrc.set_property("leaky-type", "downstream")
+
+    def _timestamp(self, index: int) -> int:
+        """Presentation time of frame `index`, rounded once from exact time."""
+        period_num, period_den = self._period
+        return index * period_num // period_den
+
+    def write(self, frame: Buffer) -> None:
+        """Write a frame (bytes or array) to the output."""
+        view = memoryview(frame)
+        if not view.c_contiguous:
+            # Strided input (e.g. a sliced array) is packed once here
+            frame = view.tobytes()
+
+        # Reuse pooled memory for frames of the negotiated size; anything
+        # else (e.g. unpadded rows) still gets a buffer of its own
+        pool = self.pool if view.nbytes == self.frame_size else None
+
+        index = self.frame_count
+        timestamp = self._timestamp(index)
+        duration = self._timestamp(index + 1) - timestamp
+        ret = buffer.push(self.appsrc, frame, timestamp, duration, pool)
+        if ret != Gst.FlowReturn.OK:
+            self._push_failed(ret, 1)
+        self.frame_count += 1
+
+        # Start pipeline on first write, once the first frame is queued
+        if not self.started:
+            self._start_pipeline()
+
+    def write_batch(self, frames: Sequence[Buffer]) -> None:
+        """Write several frames with a single appsrc push."""
+        if not frames:
+            return
+
+        buffers = []
+        timestamp = self._timestamp(self.frame_count)
+        for index, frame in enumerate(frames, self.frame_count + 1):
+            view = memoryview(frame)
+            data = frame if view.c_contiguous else view.tobytes()
+            # Not pooled: the batch holds every buffer until the push, which
+            # could drain a bounded pool and block acquire indefinitely
+            end = self._timestamp(index)
+            buffers.append(buffer.write(data, timestamp, end - timestamp))
+            timestamp = end
+
+        ret = buffer.push_list(self.appsrc, buffers)
+        if ret != Gst.FlowReturn.OK:
+            self._push_failed(ret, len(buffers))
+        self.frame_count += len(buffers)
 
-    def write(self, frame: bytes) -> None:
-        """Write a frame to the output."""
-        # Start pipeline on first write if not already started
         if not self.started:
-            # Push the frame first, then start the pipeline
-            timestamp = self.frame_count * self.fps_ns
-            buffer.push(self.appsrc, frame, timestamp, self.fps_ns)
-            self.frame_count += 1
             self._start_pipeline()
-        else:
-            # Normal operation - pipeline already started
-            timestamp = self.frame_count * self.fps_ns
-            buffer.push(self.appsrc, frame, timestamp, self.fps_ns)
-            self.frame_count += 1
+
+    def _push_failed(self, ret: Gst.FlowReturn, frames: int) -> None:
+        """Count dropped frames, warning at most once per second."""
+        self.dropped += frames
+        now = time.monotonic()
+        if now - self._dropped_logged_at >= 1.0:
+            self._dropped_logged_at = now
+            logger.warning("Frame push returned %s, %d dropped", ret, self.dropped)
 
     def close(self) -> None:
         """Close and cleanup resources."""
         try:
             if self.started:
-                self.appsrc.emit("end-of-stream")
+                self.appsrc.end_of_stream()
                 control.wait_for_eos(self.pipe, timeout_seconds=self.eos_timeout)
         finally:
             if self.started:
                 control.stop(self.pipe)
+            if self.pool is not None:
+                self.pool.set_active(False)
 
 
 class SHMWriter(VideoWriter):
@@ -69,6 +193,7 @@ class SHMWriter(VideoWriter):
         format: str = "RGB",
         is_live: bool = True,
         do_timestamp: bool = True,
+        leaky: bool = False,
     ):
         video_caps = caps.raw(width=width, height=height, fps=FPS(fps), format=format)
         src = element.appsrc(
@@ -78,7 +203,7 @@ class SHMWriter(VideoWriter):
 
         pipe = pipeline.chain(src, sink, name="shm-writer")
 
-        super().__init__(pipe, src, fps)
+        super().__init__(pipe, src, fps, leaky=leaky)
 
 
 class RTMPWriter(VideoWriter):
@@ -94,20 +219,21 @@ class RTMPWriter(VideoWriter):
         bitrate: int = 2000,
         is_live: bool = True,
         do_timestamp: bool = True,
+        leaky: bool = False,
     ):
         video_caps = caps.raw(width=width, height=height, fps=FPS(fps), format=format)
         src = element.appsrc(
             caps=video_caps, is_live=is_live, do_timestamp=do_timestamp
         )
-        convert = element.videoconvert()
+        convert = _encoder_input(format)
         encoder = element.x264enc(bitrate=bitrate)
 
         muxer = element.flvmux()
         sink = element.rtmpsink(location=url)
 
-        pipe = pipeline.chain(src, convert, encoder, muxer, sink, name="rtmp-writer")
+        pipe = pipeline.chain(src, *convert, encoder, muxer, sink, name="rtmp-writer")
 
-        super().__init__(pipe, src, fps)
+        super().__init__(pipe, src, fps, leaky=leaky)
 
 
 class UDPWriter(VideoWriter):
@@ -124,21 +250,24 @@ class UDPWriter(VideoWriter):
         bitrate: int = 2000,
         is_live: bool = True,
         do_timestamp: bool = True,
+        leaky: bool = False,
     ):
         video_caps = caps.raw(width=width, height=height, fps=FPS(fps), format=format)
         src = element.appsrc(
             caps=video_caps, is_live=is_live, do_timestamp=do_timestamp
         )
-        convert = element.videoconvert()
+        convert = _encoder_input(format)
         encoder = element.x264enc(
             bitrate=bitrate, tune="zerolatency", speed_preset="ultrafast"
         )
         payloader = element.create("rtph264pay", {"config-interval": 1, "pt": 96}, None)
         sink = element.udpsink(host=host, port=port)
 
-        pipe = pipeline.chain(src, convert, encoder, payloader, sink, name="udp-writer")
+        pipe = pipeline.chain(
+            src, *convert, encoder, payloader, sink, name="udp-writer"
+        )
 
-        super().__init__(pipe, src, fps)
+        super().__init__(pipe, src, fps, leaky=leaky)
 
 
 class FileWriter(VideoWriter):
@@ -154,16 +283,17 @@ class FileWriter(VideoWriter):
         bitrate: int = 2000,
         is_live: bool = True,
         do_timestamp: bool = True,
+        leaky: bool = False,
     ):
         video_caps = caps.raw(width=width, height=height, fps=FPS(fps), format=format)
         src = element.appsrc(
             caps=video_caps, is_live=is_live, do_timestamp=do_timestamp
         )
-        convert = element.videoconvert()
+        convert = _encoder_input(format)
         encoder = element.x264enc(bitrate=bitrate)
         muxer = element.create("mp4mux", None, None)
         sink = element.create("filesink", {"location": filepath}, None)
 
-        pipe = pipeline.chain(src, convert, encoder, muxer, sink, name="file-writer")
+        pipe = pipeline.chain(src, *convert, encoder, muxer, sink, name="file-writer")
 
-        super().__init__(pipe, src, fps)
+        super().__init__(pipe, src, fps, leaky=leaky)
@@ -1,5 +1,6 @@
 """Optimized benchmarks for recorder - only meaningful performance tests."""
 
+import shutil
 import tempfile
 import time
 from pathlib import Path
@@ -7,7 +8,12 @@ from pathlib import Path
 import pytest
 
 from .recorder import Recorder
-from .test_helpers import create_solid_frame, create_test_frame
+from .test_helpers import (
+    TMPFS,
+    create_solid_frame,
+    create_test_frame,
+    recording_size,
+)
 
 
 @pytest.mark.benchmark
@@ -16,16 +22,11 @@ class TestRecorderPerformance:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
+        self.temp_dir = tempfile.mkdtemp(dir=TMPFS)
 
     def teardown_method(self):
         """Clean up after tests."""
-        # Clean up any test files
-        for file_path in Path(self.temp_dir).glob("*.mp4"):
-            try:
-                file_path.unlink()
-            except Exception:
-                pass
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
 
     def test_benchmark_real_mp4_encoding_throughput(self, benchmark):
         """Benchmark actual MP4 encoding performance with real writer."""
@@ -56,9 +57,7 @@ class TestRecorderPerformance:
                 final_path = recorder.stop(action_id)
 
                 # Verify file was actually created
-                if final_path and Path(final_path).exists():
-                    return Path(final_path).stat().st_size
-                return 0
+                return recording_size(final_path)
 
             file_size = benchmark(encode_video)
 
@@ -223,15 +222,11 @@ class TestRecorderMemoryPerformance:
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
+        self.temp_dir = tempfile.mkdtemp(dir=TMPFS)
 
     def teardown_method(self):
         """Clean up after tests."""
-        for file_path in Path(self.temp_dir).glob("*.mp4"):
-            try:
-                file_path.unlink()
-            except Exception:
-                pass
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
 
     def test_benchmark_memory_usage_large_recording(self, benchmark):
         """Benchmark memory efficiency with large recording."""
@@ -257,9 +252,7 @@ class TestRecorderMemoryPerformance:
 
                 final_path = recorder.stop(action_id)
 
-                if final_path and Path(final_path).exists():
-                    return Path(final_path).stat().st_size
-                return 0
+                return recording_size(final_path)
 
             file_size = benchmark(large_recording)
             assert file_size > 0, "Large recording failed"
@@ -1,7 +1,9 @@
 """Simplified video recorder with clean API."""
 
+import threading
 import time
-from collections.abc import Callable
+from collections.abc import Buffer, Callable
+from functools import partial
 from pathlib import Path
 
 import numpy as np
@@ -9,6 +11,9 @@ import numpy as np
 from optr.core.io.writer import BackgroundWriter, Closable
 from optr.media.mp4 import MP4Writer
 
+# Most idle frame buffers kept for reuse
+FRAME_POOL_SIZE = 16
+
 
 class Recorder:
     """Video recorder with simplified API."""
@@ -20,6 +25,7 @@ class Recorder:
         height: int = 720,
         fps: float = 24.0,
         writer_factory: Callable[[Path], Closable] | None = None,
+        max_queued_frames: int | None = None,
     ):
         """Initialize recorder.
 
@@ -29,6 +35,9 @@ class Recorder:
             height: Frame height
             fps: Frames per second
             writer_factory: Factory function to create writers (defaults to BackgroundWriter(MP4Writer))
+            max_queued_frames: Frames a default writer may hold back before
+                dropping new ones (defaults to 10 seconds of video, at least
+                128; 0 means unbounded)
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -38,14 +47,28 @@ class Recorder:
         self.height = height
         self.fps = fps
 
+        # Bound the encoder backlog so a slow encoder drops frames instead
+        # of growing memory without limit
+        if max_queued_frames is None:
+            max_queued_frames = max(int(fps * 10), 128)
+        self.max_queued_frames = max_queued_frames
+
         # Writer factory - defaults to background MP4 writer for non-blocking writes
         self.writer_factory = writer_factory or (
-            lambda path: BackgroundWriter(MP4Writer(path, width, height, fps))
+            lambda path: BackgroundWriter(
+                MP4Writer(path, width, height, fps), capacity=max_queued_frames
+            )
         )
 
         # Active recordings: id -> (Writer, metadata)
         self.recordings: dict[str, tuple[Closable, dict]] = {}
 
+        # Frame buffers returned by background writers, shared by recordings
+        self._frame_pool: list[np.ndarray] = []
+
+        # Guards frame counts, which threads writing one recording share
+        self._count_lock = threading.Lock()
+
     def start(self, id: str) -> str:
         """Start recording.
 
@@ -106,13 +129,24 @@ class Recorder:
         return metadata["file_path"]
 
     def write(
-        self, id: str, frames: bytes | np.ndarray | list[bytes | np.ndarray]
+        self, id: str, frames: Buffer | list[Buffer], handoff: bool = False
     ) -> bool:
         """Write frames to recording.
 
+        Arrays and writable buffers are copied. Read-only buffers such as
+        bytes are queued as views without a copy, so their memory must not
+        change until the frame has been written.
+
         Args:
             id: Recording identifier
-            frames: Single frame or list of frames (bytes or numpy arrays)
+            frames: Single frame or list of frames (numpy arrays, bytes or
+                any other buffer such as a memoryview)
+            handoff: Give the frames to the recorder instead of having them
+                copied; the caller must not touch them afterwards. Buffers
+                from acquire_frame() are returned to the pool once written,
+                if the background writer wraps a writer with
+                `releases_items = True` (done with each frame when write()
+                returns), such as MP4Writer
 
         Returns:
             bool: True if frames were written successfully
@@ -124,17 +158,55 @@ class Recorder:
 
         # Handle single frame or list of frames
         frame_list = frames if isinstance(frames, list) else [frames]
+        shape = (self.height, self.width, 3)
+
+        # Buffers are only recycled through background writers wrapping a
+        # writer that declares it keeps nothing once write() returns; others
+        # may hold on to frames, which a reused buffer would overwrite
+        recycler = (
+            writer
+            if isinstance(writer, BackgroundWriter)
+            and getattr(writer.writer, "releases_items", False)
+            else None
+        )
 
+        written = 0
         try:
             for frame in frame_list:
-                # Convert bytes to numpy array if needed
-                if isinstance(frame, bytes):
-                    frame_array = np.frombuffer(frame, dtype=np.uint8)
-                    frame = frame_array.reshape((self.height, self.width, 3))
-
-                # Write frame
-                writer.write(frame)
-                metadata["frame_count"] += 1
+                # Writers take ownership of the frame. Handed-off frames and
+                # views of read-only buffers are queued as is; anything the
+                # caller may still modify is snapshotted
+                copy = not handoff
+                if not isinstance(frame, np.ndarray):
+                    frame = np.frombuffer(frame, dtype=np.uint8).reshape(shape)
+                    copy = copy and frame.flags.writeable
+
+                pooled = (
+                    recycler is not None
+                    and frame.shape == shape
+                    and frame.dtype == np.uint8
+                )
+                if copy:
+                    if pooled:
+                        snapshot = self.acquire_frame()
+                        np.copyto(snapshot, frame)
+                        frame = snapshot
+                    else:
+                        frame = frame.copy()
+
+                # The recycler hands each frame it owns outright back once
+                # written, so frame-sized buffers cycle through the pool.
+                # Views stay out: reusing them would write into their base
+                if (
+                    recycler is not None
+                    and pooled
+                    and frame.flags.owndata
+                    and frame.flags.writeable
+                ):
+                    recycler.write(frame, release=partial(self._release_frame, frame))
+                else:
+                    writer.write(frame)
+                written += 1
 
             return True
 
@@ -142,6 +214,27 @@ class Recorder:
             print(f"Warning: Failed to write frames to recording {id}: {e}")
             return False
 
+        finally:
+            # One locked update per call; += on the shared dict is not atomic
+            with self._count_lock:
+                metadata["frame_count"] += written
+
+    def acquire_frame(self) -> np.ndarray:
+        """Get a frame buffer to fill and pass to write(..., handoff=True).
+
+        Buffers come from the recorder's pool when one is free, so capture
+        code can reuse memory instead of allocating a frame per call.
+        """
+        try:
+            return self._frame_pool.pop()
+        except IndexError:
+            return np.empty((self.height, self.width, 3), dtype=np.uint8)
+
+    def _release_frame(self, frame: np.ndarray) -> None:
+        """Return a written frame buffer to the pool."""
+        if len(self._frame_pool) < FRAME_POOL_SIZE:
+            self._frame_pool.append(frame)
+
     def close(self):
         """Close all recordings and clean up resources."""
         # Stop all active recordings
@@ -216,6 +309,8 @@ class Recorder:
         if hasattr(writer, "queued") and hasattr(writer, "written"):
             status_info["queued"] = writer.queued
             status_info["written"] = writer.written
+        if hasattr(writer, "dropped"):
+            status_info["dropped"] = writer.dropped
 
         return status_info
 
@@ -256,6 +351,8 @@ class Recorder:
             if hasattr(writer, "queued") and hasattr(writer, "written"):
                 status_info["queued"] = writer.queued
                 status_info["written"] = writer.written
+            if hasattr(writer, "dropped"):
+                status_info["dropped"] = writer.dropped
 
             result[id] = status_info
 
@@ -1,13 +1,22 @@
 """Shared test utilities for recorder tests and benchmarks."""
 
+import os
 import tempfile
+from functools import lru_cache
 
 import numpy as np
 
+# RAM-backed directory for test output where available, else the default
+TMPFS = "/dev/shm" if os.path.isdir("/dev/shm") else None
 
+
+@lru_cache(maxsize=64)
 def create_test_frame(frame_num=0, width=640, height=480):
     """Create a test frame with specific pattern.
 
+    Frames are immutable bytes, so repeated calls with the same arguments
+    return the same cached object instead of rebuilding it.
+
     Args:
         frame_num: Frame number for pattern variation
         width: Frame width
@@ -16,11 +25,12 @@ def create_test_frame(frame_num=0, width=640, height=480):
     Returns:
         bytes: Frame data as bytes
     """
-    frame = np.zeros((height, width, 3), dtype=np.uint8)
-    # Create a gradient pattern with frame counter
-    for i in range(height):
-        intensity = int(255 * i / height)
-        frame[i, :] = (intensity, (intensity + frame_num) % 256, 255 - intensity)
+    # Create a gradient pattern with frame counter, one row color per line
+    intensity = (255 * np.arange(height) / height).astype(np.int64)
+    rows = np.stack(
+        [intensity, (intensity + frame_num) % 256, 255 - intensity], axis=-1
+    ).astype(np.uint8)
+    frame = np.broadcast_to(rows[:, np.newaxis, :], (height, width, 3))
     return frame.tobytes()
 
 
@@ -66,3 +76,13 @@ def create_solid_frame(color=(128, 64, 192), width=640, height=480):
     """Create solid color frame."""
     frame = np.full((height, width, 3), color, dtype=np.uint8)
     return frame.tobytes()
+
+
+def recording_size(path):
+    """Size of a finished recording in bytes, 0 if missing (one stat call)."""
+    if not path:
+        return 0
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
+        return 0
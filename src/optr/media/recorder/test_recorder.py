@@ -1,5 +1,6 @@
 """Focused test suite for Recorder with deterministic, meaningful tests."""
 
+import shutil
 import tempfile
 import threading
 from pathlib import Path
@@ -8,13 +9,18 @@ from unittest.mock import Mock, patch
 import numpy as np
 import pytest
 
+from optr.core.io.writer import BackgroundWriter
+
 from .recorder import Recorder
-from .test_helpers import create_solid_frame, create_test_frame
+from .test_helpers import TMPFS, create_solid_frame, create_test_frame
 
 
 class MockWriter:
     """Thread-safe mock writer for testing without file I/O."""
 
+    # Frames are stored as copies, so buffers can be reused after write()
+    releases_items = True
+
     def __init__(self, path):
         self.path = path
         self.frames = []
@@ -39,11 +45,11 @@ class MockWriter:
             self.close_event.set()
 
 
-class TestRecorderCore:
-    """Core functionality tests."""
+class MockRecorderTest:
+    """Shared setup: a 640x480 recorder backed by MockWriters."""
 
     def setup_method(self):
-        self.temp_dir = tempfile.mkdtemp()
+        self.temp_dir = tempfile.mkdtemp(dir=TMPFS)
         self.mock_writers = {}
 
         def mock_factory(path):
@@ -61,6 +67,11 @@ class TestRecorderCore:
 
     def teardown_method(self):
         self.recorder.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+
+class TestRecorderCore(MockRecorderTest):
+    """Core functionality tests."""
 
     def test_start_creates_recording_with_metadata(self):
         """Test that start() creates recording with proper metadata."""
@@ -111,6 +122,118 @@ class TestRecorderCore:
         _, metadata = self.recorder.recordings["test"]
         assert metadata["frame_count"] == 4
 
+    def test_write_buffer_frames(self):
+        """Test writing memoryview and bytearray frames."""
+        path = self.recorder.start("test")
+        frame_bytes = create_test_frame(width=640, height=480)
+
+        assert self.recorder.write("test", memoryview(frame_bytes))
+        assert self.recorder.write("test", bytearray(frame_bytes))
+
+        frames = self.mock_writers[path].frames
+        assert len(frames) == 2
+        for frame in frames:
+            assert frame.shape == (480, 640, 3)
+            assert frame.tobytes() == frame_bytes
+
+    def test_array_snapshots_reuse_pooled_buffers(self):
+        """Test array frames are snapshotted into buffers returned after writing."""
+        writers = []
+
+        def background_factory(path):
+            writer = MockWriter(path)
+            writers.append(writer)
+            return BackgroundWriter(writer)
+
+        recorder = Recorder(
+            output_dir=self.temp_dir,
+            width=64,
+            height=48,
+            fps=30.0,
+            writer_factory=background_factory,
+        )
+
+        frame = np.zeros((48, 64, 3), dtype=np.uint8)
+        recorder.start("pooled")
+        for value in range(5):
+            frame.fill(value)
+            assert recorder.write("pooled", frame)
+        recorder.stop("pooled")
+
+        # Mutating the caller's array never leaks into queued frames
+        assert [int(f[0, 0, 0]) for f in writers[0].frames] == list(range(5))
+        assert len(recorder._frame_pool) >= 1
+
+        # The next snapshot comes from the pool instead of a new allocation
+        pooled = recorder._frame_pool[-1]
+        recorder.start("again")
+        recorder.write("again", frame)
+        recorder.stop("again")
+        assert any(buf is pooled for buf in recorder._frame_pool)
+
+    def test_handoff_acquired_frames_without_copy(self):
+        """Test acquired frames handed off are written as is and pooled again."""
+        written = []
+
+        def background_factory(path):
+            # Keeps references only to check identities, so opting in to
+            # buffer reuse is safe here
+            writer = Mock(spec=["write", "close", "releases_items"])
+            writer.releases_items = True
+            writer.write.side_effect = written.append
+            return BackgroundWriter(writer)
+
+        recorder = Recorder(
+            output_dir=self.temp_dir,
+            width=64,
+            height=48,
+            fps=30.0,
+            writer_factory=background_factory,
+        )
+
+        recorder.start("handoff")
+        frame = recorder.acquire_frame()
+        frame.fill(7)
+        assert recorder.write("handoff", frame, handoff=True)
+
+        # Views of other arrays are never pooled
+        view = np.zeros((48, 64, 3), dtype=np.uint8)[:]
+        assert recorder.write("handoff", view, handoff=True)
+        recorder.stop("handoff")
+
+        assert written[0] is frame
+        assert written[1] is view
+        assert [id(buf) for buf in recorder._frame_pool] == [id(frame)]
+
+    def test_retaining_writers_get_unpooled_frames(self):
+        """Test writers that keep frames never see their buffers reused."""
+        kept = []
+
+        def background_factory(path):
+            writer = Mock(spec=["write", "close"])
+            writer.write.side_effect = kept.append
+            return BackgroundWriter(writer)
+
+        recorder = Recorder(
+            output_dir=self.temp_dir,
+            width=64,
+            height=48,
+            fps=30.0,
+            writer_factory=background_factory,
+        )
+
+        frame = np.zeros((48, 64, 3), dtype=np.uint8)
+        for run in range(2):
+            recorder.start(f"run{run}")
+            for value in range(3):
+                frame.fill(run * 10 + value)
+                assert recorder.write(f"run{run}", frame)
+            recorder.stop(f"run{run}")
+
+        # Kept frames still hold what was written, even across recordings
+        assert [int(f[0, 0, 0]) for f in kept] == [0, 1, 2, 10, 11, 12]
+        assert recorder._frame_pool == []
+
     def test_write_to_nonexistent_recording_fails(self):
         """Test writing to non-existent recording returns False."""
         frame_bytes = create_test_frame()
@@ -209,29 +332,9 @@ class TestRecorderCore:
             assert writer.closed
 
 
-class TestRecorderErrorHandling:
+class TestRecorderErrorHandling(MockRecorderTest):
     """Error handling and edge case tests."""
 
-    def setup_method(self):
-        self.temp_dir = tempfile.mkdtemp()
-        self.mock_writers = {}
-
-        def mock_factory(path):
-            writer = MockWriter(path)
-            self.mock_writers[str(path)] = writer
-            return writer
-
-        self.recorder = Recorder(
-            output_dir=self.temp_dir,
-            width=640,
-            height=480,
-            fps=30.0,
-            writer_factory=mock_factory,
-        )
-
-    def teardown_method(self):
-        self.recorder.close()
-
     def test_write_with_writer_error_returns_false(self):
         """Test that writer errors are handled gracefully."""
         failing_writer = Mock()
@@ -504,11 +607,12 @@ class TestRecorderIntegration:
     """Integration tests with real components."""
 
     def setup_method(self):
-        self.temp_dir = tempfile.mkdtemp()
+        self.temp_dir = tempfile.mkdtemp(dir=TMPFS)
         self.recorder = Recorder(output_dir=self.temp_dir)
 
     def teardown_method(self):
         self.recorder.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
 
     def test_full_recording_workflow(self):
         """Test complete recording workflow."""
@@ -534,6 +638,20 @@ class TestRecorderIntegration:
         assert final_path == path
         assert "workflow_test" not in self.recorder.recordings
 
+    def test_default_writer_queue_is_bounded(self):
+        """Test default writers cap their backlog and report drops."""
+        recorder = Recorder(output_dir=self.temp_dir, max_queued_frames=5)
+        try:
+            recorder.start("bounded")
+            writer, _ = recorder.recordings["bounded"]
+            assert writer.capacity == 5
+            assert recorder.status("bounded")["dropped"] == 0
+        finally:
+            recorder.close()
+
+        # Ten seconds of video, at least 128 frames, by default
+        assert self.recorder.max_queued_frames == 240
+
     def test_concurrent_recordings_isolated(self):
         """Test multiple recordings don't interfere."""
         # Start multiple recordings
@@ -591,29 +709,9 @@ class TestRecorderIntegration:
             recorder.close()
 
 
-class TestRecorderThreadSafety:
+class TestRecorderThreadSafety(MockRecorderTest):
     """Thread safety tests with deterministic synchronization."""
 
-    def setup_method(self):
-        self.temp_dir = tempfile.mkdtemp()
-        self.mock_writers = {}
-
-        def mock_factory(path):
-            writer = MockWriter(path)
-            self.mock_writers[str(path)] = writer
-            return writer
-
-        self.recorder = Recorder(
-            output_dir=self.temp_dir,
-            width=640,
-            height=480,
-            fps=30.0,
-            writer_factory=mock_factory,
-        )
-
-    def teardown_method(self):
-        self.recorder.close()
-
     def test_concurrent_writes_maintain_frame_integrity(self):
         """Test that concurrent writes don't corrupt frames."""
         self.recorder.start("test")
@@ -626,10 +724,13 @@ class TestRecorderThreadSafety:
         barrier = threading.Barrier(3)  # 3 threads
 
         def write_unique_frames(thread_id):
+            # One buffer per thread, refilled in place: the recorder
+            # snapshots arrays, so reuse must not leak into written frames
+            frame = np.empty((480, 640, 3), dtype=np.uint8)
             barrier.wait()  # Synchronize start
             for i in range(10):
-                # Create frame with unique pattern for this thread
-                frame = np.full((480, 640, 3), thread_id * 100 + i, dtype=np.uint8)
+                # Fill frame with unique pattern for this thread
+                frame.fill(thread_id * 100 + i)
                 success = self.recorder.write("test", frame)
                 results.append((thread_id, i, success))
 
@@ -656,6 +757,10 @@ class TestRecorderThreadSafety:
                 f"Frame corrupted: has {len(unique_values)} unique values"
             )
 
+        # Every pattern arrives exactly once despite the shared buffers
+        values = sorted(int(frame[0, 0, 0]) for frame in mock_writer.frames)
+        assert values == sorted(t * 100 + i for t in range(3) for i in range(10))
+
         # Verify frame count is correct
         status = self.recorder.status("test")
         assert status["frame_count"] == 30
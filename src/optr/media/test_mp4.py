@@ -19,7 +19,13 @@ class TestMP4Writer:
 
         path = Path("test.mp4")
         writer = MP4Writer(
-            path, width=640, height=480, fps=24.0, codec="h264", quality=5
+            path,
+            width=640,
+            height=480,
+            fps=24.0,
+            codec="h264",
+            quality=5,
+            preset="ultrafast",
         )
 
         mock_get_writer.assert_called_once_with(
@@ -29,6 +35,7 @@ class TestMP4Writer:
             quality=5,
             pixelformat="yuv420p",
             macro_block_size=1,
+            ffmpeg_params=["-preset", "ultrafast"],
         )
         assert writer.path == path
         assert writer.width == 640
@@ -49,6 +56,24 @@ class TestMP4Writer:
 
         mock_writer.append_data.assert_called_once_with(frame)
 
+    @patch("optr.media.mp4.imageio.get_writer")
+    def test_write_batch_appends_in_order(self, mock_get_writer):
+        """Test write_batch appends every frame in order."""
+        mock_writer = MagicMock()
+        mock_get_writer.return_value = mock_writer
+
+        writer = MP4Writer(Path("test.mp4"), width=640, height=480)
+        frames = [np.full((480, 640, 3), i, dtype=np.uint8) for i in range(3)]
+
+        writer.write_batch(frames)
+
+        calls = mock_writer.append_data.call_args_list
+        assert [call.args[0] for call in calls] == frames
+
+        writer.close()
+        writer.write_batch(frames)
+        assert mock_writer.append_data.call_count == 3
+
     @patch("optr.media.mp4.imageio.get_writer")
     def test_write_after_close_ignored(self, mock_get_writer):
         """Test write after close is ignored."""